@@ -1,61 +1,139 @@
 from datetime import datetime
 from airflow import DAG
 from airflow.operators.python import PythonOperator
-import json
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 import logging
 from kafka import KafkaProducer
 import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+logger = logging.getLogger(__name__)
 
 default_args = {
     'owner': 'airscholar',
     'start_date': datetime(2024, 6, 25, 10, 00)
 }
 
-def get_data():
-    res = requests.get('https://randomuser.me/api/')
-    res = res.json()
-    res = res['results'][0]
+# Number of API fetches kept in flight while streaming; each one already returns a
+# full batch, so a second fetch only hides the round trip without hammering the API
+MAX_WORKERS = 2
+# Users requested per API call
+BATCH_SIZE = 500
+# Messages sent between progress log lines
+LOG_EVERY = 1000
+# Seconds to wait before retrying a failed fetch, doubled per consecutive failure
+FETCH_BACKOFF = 1
+MAX_FETCH_BACKOFF = 8
+
+# Shared HTTP session so every API call reuses the same keep-alive connection
+_SESSION = requests.Session()
+_SESSION.headers['Connection'] = 'keep-alive'
+_SESSION.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=MAX_WORKERS))
+
+def get_data(results=BATCH_SIZE, session=_SESSION):
+    res = session.get('https://randomuser.me/api/', params={'results': results}, timeout=10)
+    res.raise_for_status()
+    res = orjson.loads(res.content)
+    res = res['results']
     return res
 
 def format_data(res):
-    data = {}
+    name = res['name']
     location = res['location']
-    data['first_name'] = res['name']['first']
-    data['last_name'] = res['name']['last']
-    data['gender'] = res['gender']
-    data['address'] = f"{str(location['street']['number'])} {location['street']['name']} " \
-                     f"{location['city']}, {location['state']}, {location['country']}"
-    data['postcode'] = location['postcode']
-    data['email'] = res['email']
-    data['username'] = res['login']['username']
-    data['dob'] = res['dob']['date']
-    data['registered_date'] = res['registered']['date']
-    data['phone'] = res['phone']
-    data['picture'] = res['picture']['medium']
-    return data
+    street = location['street']
+    return {
+        'first_name': name['first'],
+        'last_name': name['last'],
+        'gender': res['gender'],
+        'address': '%s %s %s, %s, %s' % (street['number'], street['name'],
+                                         location['city'], location['state'], location['country']),
+        'postcode': location['postcode'],
+        'email': res['email'],
+        'username': res['login']['username'],
+        'dob': res['dob']['date'],
+        'registered_date': res['registered']['date'],
+        'phone': res['phone'],
+        'picture': res['picture']['medium'],
+    }
+
+def _fetch(delay=0):
+    if delay:
+        time.sleep(delay)
+    return get_data()
+
+def _record_stream(seconds):
+    """Yield formatted users from concurrent batched API fetches for `seconds` seconds."""
+    deadline = time.monotonic() + seconds
+
+    executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+    try:
+        in_flight = {executor.submit(_fetch) for _ in range(MAX_WORKERS)}
+        failures = 0
+        while True:
+            done, in_flight = wait(in_flight, timeout=max(0, deadline - time.monotonic()),
+                                   return_when=FIRST_COMPLETED)
+            if not done:
+                break
+            for future in done:
+                try:
+                    batch = future.result()
+                except Exception as e:
+                    failures += 1
+                    delay = min(FETCH_BACKOFF * 2 ** (failures - 1), MAX_FETCH_BACKOFF)
+                    logger.error(f'An error occurred: {e}; retrying in {delay}s')
+                    in_flight.add(executor.submit(_fetch, delay))
+                    continue
+                failures = 0
+                in_flight.add(executor.submit(_fetch))
+                for res in batch:
+                    if time.monotonic() >= deadline:
+                        return
+                    try:
+                        record = format_data(res)
+                    except Exception as e:
+                        logger.error(f'An error occurred: {e}')
+                        continue
+                    yield record
+    finally:
+        # Drop fetches still pending at the deadline instead of waiting on them
+        executor.shutdown(wait=False, cancel_futures=True)
 
 def stream_data():
     logging.basicConfig(level=logging.INFO)
-    logger = logging.getLogger(__name__)
 
     try:
         logger.info("Starting data streaming process")
-        producer = KafkaProducer(bootstrap_servers=['broker:29092'], max_block_ms=5000)
+        producer = KafkaProducer(bootstrap_servers=['broker:29092'],
+                                 max_block_ms=5000,
+                                 linger_ms=100,
+                                 batch_size=64 * 1024,
+                                 compression_type='lz4',
+                                 acks=1,
+                                 value_serializer=orjson.dumps)
         logger.info("Kafka Producer initialized")
-        curr_time = time.time()
+        topic = 'users_created'
+        send = producer.send
+        try:
+            producer.partitions_for(topic)  # Warm topic metadata before the first send
+        except Exception as e:
+            logger.warning(f"Could not prefetch metadata for topic '{topic}': {e}")
+        log_progress = logger.isEnabledFor(logging.INFO)
+        sent = 0
 
-        while True:
-            if time.time() > curr_time + 60:  # Stream for 1 minute
-                break
+        for record in _record_stream(60):  # Stream for 1 minute
             try:
-                res = get_data()
-                formatted_data = format_data(res)
-                producer.send('users_created', json.dumps(formatted_data).encode('utf-8'))
-                logger.info("Message sent to Kafka topic 'users_created'")
+                send(topic, record)
             except Exception as e:
                 logger.error(f'An error occurred: {e}')
                 continue
+            sent += 1
+            if log_progress and sent % LOG_EVERY == 0:
+                logger.info("%d messages sent to Kafka topic '%s'", sent, topic)
+
+        producer.flush()
+        logger.info("%d messages sent to Kafka topic '%s'", sent, topic)
 
     except Exception as e:
         logger.error(f"An error occurred in the streaming process: {e}")
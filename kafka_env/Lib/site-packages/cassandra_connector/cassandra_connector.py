@@ -1,10 +1,36 @@
 from cassandra.cluster import Cluster
+import hashlib
 import os
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+import re
 import requests
-from tempfile import gettempdir
+from tempfile import gettempdir, NamedTemporaryFile
 import time
 from urllib.parse import urlparse
 
+# Auth provider classes resolved from their dotted import path, keyed by that path
+_AUTH_PROVIDER_CACHE = {}
+
+# Astra API endpoint host: <datacenterID (UUID)>-<regionName>.apps.astra.datastax.com
+_ENDPOINT_RE = re.compile(
+    r'^([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})-(.+?)\.apps\.astra\.datastax\.com$'
+)
+
+# Secure bundle URL listings keyed by (request URL, token hash); the download URLs are
+# signed and short-lived, so entries are only reused for a brief window
+_BUNDLE_URLS_CACHE = {}
+_BUNDLE_URLS_TTL = 60
+
+# Age after which a downloaded secure connect bundle is fetched again
+_SCB_TTL = 360 * 24 * 60 * 60
+
+# Recently validated secure connect bundles: (datacenterID, regionName) -> (scb_path, checked_at)
+_SCB_CACHE = {}
+_SCB_CACHE_TTL = 60
+
 class CassandraConnector:
     """
     A connector for establishing connections with Cassandra or Astra databases. This class
@@ -20,6 +46,9 @@ class CassandraConnector:
         cluster (Cluster): The Cassandra cluster object, initialized upon a successful connection.
         session (Session): The session object for executing queries on the Cassandra cluster.
     """
+    # Shared across instances so repeated Astra setups reuse the TLS connection to the API
+    _http_session = requests.Session()
+
     def __init__(self, **connection_args):
         """
         Initializes a new instance of the CassandraConnector class.
@@ -70,39 +99,41 @@ class CassandraConnector:
             self._setup_cassandra_connection()
 
     @property
-    def session(self, new=False, replace=False):
+    def session(self):
         """
-        Provides access to the Cassandra session object for executing queries. This property allows
-        for the retrieval of the current session, the creation of a new session instance without
-        affecting the current session, or the replacement of the current session with a new one.
+        Provides access to the Cassandra session object for executing queries.
 
-        Args:
-            new (bool): If True, creates and returns a new session instance without replacing the
-                current session maintained by the class instance. This allows for temporary sessions
-                that do not interfere with the existing session's state. Defaults to False, which
-                results in returning the existing session.
+        Returns:
+            cassandra.cluster.Session: The session object for interacting with the Cassandra cluster.
+        """
+        return self._session
 
-            replace (bool): If True, shuts down the current session and replaces it with a new one.
-                This new session becomes the session returned by subsequent calls to this property.
-                If `new` is also True, `new` takes precedence, and a new session is created and
-                returned without replacing the current session. Defaults to False.
+    def new_session(self):
+        """
+        Creates and returns a new session instance without replacing the current session
+        maintained by the class instance. This allows for temporary sessions that do not
+        interfere with the existing session's state.
 
         Returns:
-            cassandra.cluster.Session: The session object for interacting with the Cassandra cluster.
-                Depending on the parameters, this could be the existing session, a new session that
-                replaces the existing one, or a new temporary session.
+            cassandra.cluster.Session: A new session object for the Cassandra cluster.
+        """
+        return self._cluster.connect()
+
+    def replace_session(self):
+        """
+        Shuts down the current session and replaces it with a new one. The new session
+        becomes the session returned by subsequent accesses to the `session` property.
+
+        Returns:
+            cassandra.cluster.Session: The new session object for the Cassandra cluster.
 
         Note:
-            Using the `replace` option will shut down the existing session and create a new one. It's
-            important to ensure that no operations are pending or currently using the old session
-            before replacing it, as this could lead to interrupted operations or resource leaks.
-        """
-        if replace:
-            self._session.shutdown()
-            self._session = self._cluster.connect()
-            return self._session
-        if new:
-            return self._cluster.connect()
+            It's important to ensure that no operations are pending or currently using the old
+            session before replacing it, as this could lead to interrupted operations or
+            resource leaks.
+        """
+        self._session.shutdown()
+        self._session = self._cluster.connect()
         return self._session
 
     @property
@@ -126,11 +157,14 @@ class CassandraConnector:
         auth_provider_args = self._connection_args.pop('authProviderArgs', {})
 
         if auth_provider_class:
-            # Dynamically import the auth provider class
-            module_path, class_name = auth_provider_class.rsplit('.', 1)
-            module = __import__(module_path, fromlist=[class_name])
-            auth_provider_class = getattr(module, class_name)
-            auth_provider = auth_provider_class(**auth_provider_args)
+            # Dynamically import the auth provider class, once per import path
+            provider_cls = _AUTH_PROVIDER_CACHE.get(auth_provider_class)
+            if provider_cls is None:
+                module_path, class_name = auth_provider_class.rsplit('.', 1)
+                module = __import__(module_path, fromlist=[class_name])
+                provider_cls = getattr(module, class_name)
+                _AUTH_PROVIDER_CACHE[auth_provider_class] = provider_cls
+            auth_provider = provider_cls(**auth_provider_args)
         else:
             auth_provider = None
 
@@ -162,7 +196,8 @@ class CassandraConnector:
         Args:
             astra_args (dict): A dictionary containing 'endpoint' and 'token' for the
                 Astra database, and optionally 'datacenterID' and 'regionName'. If the
-                dictionary contains 'scb', that value is returned.
+                dictionary contains 'scb', that value is returned. The dictionary is
+                not modified.
 
         Returns:
             str: The file path to the secure connect bundle.
@@ -170,17 +205,24 @@ class CassandraConnector:
         if 'scb' in astra_args and astra_args['scb']:
             return astra_args['scb']
 
+        # Work on a copy so connection params shared between managers stay untouched
+        astra_args = dict(astra_args)
+
         # Ensure datacenterID and regionName are extracted from endpoint if provided
         if 'endpoint' in astra_args and astra_args['endpoint']:
             # Parse the endpoint URL
             endpoint_parsed = urlparse(astra_args['endpoint'])
-            # Extract the hostname without the domain suffix
-            hostname_without_suffix = endpoint_parsed.netloc.split('.apps.astra.datastax.com')[0]
-            # Split the hostname to get parts
-            parts = hostname_without_suffix.split('-')
-            # Datacenter is first 5 parts, everything after is region
-            datacenterID = '-'.join(parts[:5])
-            regionName = '-'.join(parts[5:])
+            match = _ENDPOINT_RE.match(endpoint_parsed.netloc)
+            if match:
+                datacenterID, regionName = match.group(1), match.group(2)
+            else:
+                # Extract the hostname without the domain suffix
+                hostname_without_suffix = endpoint_parsed.netloc.split('.apps.astra.datastax.com')[0]
+                # Split the hostname to get parts
+                parts = hostname_without_suffix.split('-')
+                # Datacenter is first 5 parts, everything after is region
+                datacenterID = '-'.join(parts[:5])
+                regionName = '-'.join(parts[5:])
 
             # Update astra_args with extracted values if not explicitly provided
             astra_args['datacenterID'] = astra_args.get('datacenterID') or datacenterID
@@ -188,6 +230,11 @@ class CassandraConnector:
         elif 'datacenterID' not in astra_args or not astra_args['datacenterID']:
             raise ValueError("Astra endpoint or datacenterID must be provided in args.")
 
+        scb_key = (astra_args['datacenterID'], astra_args.get('regionName'))
+        cached = _SCB_CACHE.get(scb_key)
+        if cached and time.monotonic() - cached[1] < _SCB_CACHE_TTL and os.path.isfile(cached[0]):
+            return cached[0]
+
         scb_dir = os.path.join(gettempdir(), "cassandra-astra")
         os.makedirs(scb_dir, exist_ok=True)
 
@@ -198,14 +245,29 @@ class CassandraConnector:
         scb_filename += ".zip"
         scb_path = os.path.join(scb_dir, scb_filename)
 
-        if not os.path.exists(scb_path) or time.time() - os.path.getmtime(scb_path) > 360 * 24 * 60 * 60:
-            download_url = self._get_secure_connect_bundle_url(astra_args)
-            response = requests.get(download_url)
-            response.raise_for_status()
+        try:
+            stale = time.time() - os.stat(scb_path).st_mtime > _SCB_TTL
+        except FileNotFoundError:
+            stale = True
 
-            with open(scb_path, 'wb') as f:
-                f.write(response.content)
-        
+        if stale:
+            download_url = self._get_secure_connect_bundle_url(astra_args)
+            # Download into a temporary file and only move it into place once complete, so a
+            # failed or concurrent download never leaves a truncated bundle at scb_path
+            tmp = NamedTemporaryFile(dir=scb_dir, suffix=".zip.part", delete=False)
+            try:
+                with tmp, self._http_session.get(download_url, stream=True, timeout=30) as response:
+                    response.raise_for_status()
+                    for chunk in response.iter_content(chunk_size=64 * 1024):
+                        tmp.write(chunk)
+                os.replace(tmp.name, scb_path)
+            except BaseException:
+                os.unlink(tmp.name)
+                # The signed download URL may have expired; don't hand it out again
+                _discard_bundle_urls(download_url)
+                raise
+
+        _SCB_CACHE[scb_key] = (scb_path, time.monotonic())
         return scb_path
 
     def _get_secure_connect_bundle_url(self, astra_args):
@@ -226,14 +288,7 @@ class CassandraConnector:
         )
         url = url_template.replace("{database_id}", astra_args['datacenterID'])
 
-        headers = {
-            'Authorization': f"Bearer {astra_args['token']}",
-            'Content-Type': 'application/json',
-        }
-        response = requests.post(url, headers=headers)
-        response.raise_for_status()
-
-        data = response.json()
+        data = _fetch_bundle_urls(self._http_session, url, astra_args['token'])
         if not data or len(data) == 0:
             raise ValueError("Failed to get secure bundle URLs.")
 
@@ -249,3 +304,45 @@ class CassandraConnector:
                 raise ValueError(f"Specific bundle for region '{astra_args['regionName']}' not found.")
 
         return download_url
+
+def _fetch_bundle_urls(http_session, url, token):
+    """
+    Fetches the list of secure connect bundles for a database, reusing a recent
+    response for the same URL and token.
+
+    Args:
+        http_session (requests.Session): The session used to issue the request.
+        url (str): The secureBundleURL endpoint for the database.
+        token (str): The application token for accessing the Astra database.
+
+    Returns:
+        tuple: The bundle descriptors returned by the Astra API.
+    """
+    key = (url, hashlib.sha256(token.encode('utf-8')).hexdigest())
+    cached = _BUNDLE_URLS_CACHE.get(key)
+    if cached and time.monotonic() - cached[0] < _BUNDLE_URLS_TTL:
+        return cached[1]
+
+    headers = {
+        'Authorization': f"Bearer {token}",
+        'Content-Type': 'application/json',
+    }
+    response = http_session.post(url, headers=headers)
+    response.raise_for_status()
+
+    bundles = tuple(json_loads(response.content) or ())
+    if bundles:
+        _BUNDLE_URLS_CACHE[key] = (time.monotonic(), bundles)
+    return bundles
+
+def _discard_bundle_urls(download_url):
+    """
+    Removes any cached bundle listing that contains the given download URL, so the
+    next attempt requests fresh signed URLs from the Astra API.
+
+    Args:
+        download_url (str): The secure connect bundle download URL that failed.
+    """
+    for key, (_, bundles) in list(_BUNDLE_URLS_CACHE.items()):
+        if any(bundle.get('downloadURL') == download_url for bundle in bundles):
+            _BUNDLE_URLS_CACHE.pop(key, None)
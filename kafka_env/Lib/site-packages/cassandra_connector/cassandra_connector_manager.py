@@ -1,5 +1,6 @@
 import json
 import os
+import threading
 from .cassandra_connector import CassandraConnector
 
 class CassandraConnectorManager:
@@ -11,26 +12,16 @@ class CassandraConnectorManager:
     """
     def __init__(self):
         """
-        Initializes the CassandraConnectionsManager instance by loading connection
+        Initializes the CassandraConnectionsManager instance with the connection
         parameters from optional environment variables for both Cassandra and Astra DB.
+        The environment is read once per process and shared by all managers.
         It sets up the structure for managing these connections.
         """
-        self._connection_params = {}
+        # Shallow copy: get_connector adds keys here, but never modifies the shared values
+        self._connection_params = dict(_get_env_params())
         self._connections = {}
-
-        # Store CASSANDRA connection params if CASSANDRA_CONNECTION env var is set
-        cassandra_conn_str = os.getenv("CASSANDRA_CONNECTION")
-        if cassandra_conn_str:
-            self._connection_params['env_cassandra'] = _parse_connection_args_json(cassandra_conn_str) 
-
-        # Store Astra connection params if Astra env vars are set
-        astra_token = os.getenv("ASTRA_DB_APPLICATION_TOKEN")
-        astra_endpoint = os.getenv("ASTRA_DB_API_ENDPOINT")
-        astra_db_id = os.getenv("ASTRA_DB_DATABASE_ID")
-        astra_db_region = os.getenv("ASTRA_DB_REGION")
-        astra_scb = os.getenv("ASTRA_DB_SECURE_BUNDLE_PATH")
-        if astra_token:
-            self._connection_params['env_astra'] = {'astra': {'token': astra_token, 'endpoint': astra_endpoint, 'datacenterID': astra_db_id, 'regionName': astra_db_region, 'scb': astra_scb}}
+        # Guards connector construction so concurrent callers don't build duplicate clusters
+        self._lock = threading.Lock()
 
     def get_connector(self, db_key='env_astra', **connection_args):
         """
@@ -63,26 +54,82 @@ class CassandraConnectorManager:
                 connection could not be initialized due to an error.
         """
         # Return the existing connector if it's already initialized
-        if db_key in self._connections:
-            return self._connections[db_key]
-        
-        if db_key not in self._connection_params and connection_args:
-            self._connection_params[db_key] = connection_args
-
-        if db_key in self._connection_params:
-            try:
-                params = self._connection_params[db_key]
-                self._connections[db_key] = CassandraConnector(**params)
-                print(f"Connection for '{db_key}' initialized successfully.")
-            except Exception as e:
-                print(f"Failed to setup connection for '{db_key}'")
-                print(f"Error: {str(e)}")
-                raise ValueError(f"Connection for '{db_key}' could not be initialized.")
-            return self._connections[db_key]
+        connector = self._connections.get(db_key)
+        if connector is not None:
+            return connector
+
+        with self._lock:
+            # Another thread may have initialized the connector while we waited
+            if db_key in self._connections:
+                return self._connections[db_key]
+
+            if db_key not in self._connection_params and connection_args:
+                self._connection_params[db_key] = connection_args
+
+            if db_key in self._connection_params:
+                try:
+                    params = self._connection_params[db_key]
+                    self._connections[db_key] = CassandraConnector(**params)
+                    print(f"Connection for '{db_key}' initialized successfully.")
+                except Exception as e:
+                    print(f"Failed to setup connection for '{db_key}'")
+                    print(f"Error: {str(e)}")
+                    raise ValueError(f"Connection for '{db_key}' could not be initialized.")
+                return self._connections[db_key]
 
         # If the connection key is not recognized or parameters were not provided
         raise ValueError(f"Connection parameters for '{db_key}' not configured.")
     
+# Connection parameters read from the environment, loaded once on first use
+_ENV_PARAMS = None
+_ENV_PARAMS_LOCK = threading.Lock()
+
+def _get_env_params():
+    """
+    Returns the connection parameters defined in environment variables, loading
+    them on the first call and reusing them afterwards. Callers must not modify
+    the returned dictionary.
+
+    Note:
+        The environment is read only once per process: changes to the Cassandra or
+        Astra environment variables after the first manager is created are ignored.
+
+    Returns:
+        dict: Connection parameters keyed by `env_cassandra` and/or `env_astra`.
+    """
+    global _ENV_PARAMS
+    if _ENV_PARAMS is None:
+        with _ENV_PARAMS_LOCK:
+            if _ENV_PARAMS is None:
+                _ENV_PARAMS = _load_env_params()
+    return _ENV_PARAMS
+
+def _load_env_params():
+    """
+    Loads connection parameters from optional environment variables for both
+    Cassandra and Astra DB.
+
+    Returns:
+        dict: Connection parameters keyed by `env_cassandra` and/or `env_astra`.
+    """
+    env_params = {}
+
+    # Store CASSANDRA connection params if CASSANDRA_CONNECTION env var is set
+    cassandra_conn_str = os.getenv("CASSANDRA_CONNECTION")
+    if cassandra_conn_str:
+        env_params['env_cassandra'] = _parse_connection_args_json(cassandra_conn_str)
+
+    # Store Astra connection params if Astra env vars are set
+    astra_token = os.getenv("ASTRA_DB_APPLICATION_TOKEN")
+    astra_endpoint = os.getenv("ASTRA_DB_API_ENDPOINT")
+    astra_db_id = os.getenv("ASTRA_DB_DATABASE_ID")
+    astra_db_region = os.getenv("ASTRA_DB_REGION")
+    astra_scb = os.getenv("ASTRA_DB_SECURE_BUNDLE_PATH")
+    if astra_token:
+        env_params['env_astra'] = {'astra': {'token': astra_token, 'endpoint': astra_endpoint, 'datacenterID': astra_db_id, 'regionName': astra_db_region, 'scb': astra_scb}}
+
+    return env_params
+
 def _parse_connection_args_json(conn_args_str):
     """
     Parses a connection arguments string in JSON format into a Python dictionary.